@@ -5,11 +5,17 @@ from pathlib import Path
 from platform import system
 from typing import Optional
 
+from pydantic import HttpUrl
+from pydantic import TypeAdapter
+
 from .configs import FeedConfigLoader
+from .feeds import DEFAULT_MAX_CONCURRENCY
 from .feeds import GameFeedCollection
 
 logger = logging.getLogger(__package__)
 
+_URL_ADAPTER = TypeAdapter(HttpUrl)
+
 
 async def create_feeds(args) -> None:
     # fallback path defined in config loader if no path given
@@ -31,29 +37,24 @@ async def create_feeds(args) -> None:
    # Aggregate mode: fetch items for all games, merge, then write once.
     collection = GameFeedCollection.from_configs(feed_configs)
 
-    import aiohttp
-    from .models import FeedFileWriterConfig, FeedType, FeedMeta
+    from .models import FeedFileWriterConfig, FeedType
     from .writers import JSONFeedFileWriter, AtomFeedFileWriter
-    from pydantic import parse_obj_as, HttpUrl
 
-    async with aiohttp.ClientSession() as session:
-        all_items = []
-        for gf in collection._game_feeds:  # reuse internal list
-            items = await gf.fetch_items(session)
-            all_items.extend(items)
-        # sort newest first by id (matches existing behavior)
-        all_items.sort(key=lambda item: item.id, reverse=True)
+    all_items = await collection.fetch_all_items(max_concurrency=args.max_concurrency)
 
-    # Build aggregate meta (pick language from the first feed; override title/home/icon).
+    # Build aggregate meta (copy the already validated meta of the first feed;
+    # override title/home/icon).
     first_meta = feed_configs[0].feed_meta
-    agg_meta = FeedMeta(
-        game=first_meta.game,  # still required; harmless placeholder
-        language=first_meta.language,
-        title=args.single_feed_title,
-        icon=(parse_obj_as(HttpUrl, args.single_icon) if args.single_icon else None),
-        home_page_url=parse_obj_as(HttpUrl, args.single_home_url),
-        category_size=first_meta.category_size,
-        categories=first_meta.categories,
+    agg_meta = first_meta.model_copy(
+        update={
+            "title": args.single_feed_title,
+            "icon": (
+                _URL_ADAPTER.validate_python(args.single_icon)
+                if args.single_icon
+                else None
+            ),
+            "home_page_url": _URL_ADAPTER.validate_python(args.single_home_url),
+        }
     )
 
     feed_type = FeedType.JSON if args.single_feed_format == "json" else FeedType.ATOM
@@ -62,10 +63,38 @@ async def create_feeds(args) -> None:
     await writer.write_feed(agg_meta, all_items)
 
 
+def _non_blank_str(value: str) -> str:
+    # the aggregate meta is copied without validation -> check the title here
+    if len(value.strip()) == 0:
+        raise argparse.ArgumentTypeError("must not be blank")
+
+    return value.strip()
+
+
+def _non_negative_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError as err:
+        raise argparse.ArgumentTypeError("invalid int value: {}".format(value)) from err
+
+    if number < 0:
+        raise argparse.ArgumentTypeError("must not be negative: {}".format(number))
+
+    return number
+
+
 def cli() -> None:
     if system() == "Windows":
         # default policy not working on windows
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # type: ignore
+    else:
+        try:
+            # optional faster event loop (see "speedups" extra)
+            import uvloop  # type: ignore[import-not-found]
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
 
     arg_parser = argparse.ArgumentParser(
         prog="hoyolab-rss-feeds", description="Generate Hoyolab RSS feeds."
@@ -89,7 +118,7 @@ def cli() -> None:
     )
     arg_parser.add_argument(
         "--single-feed-title",
-        type=str,
+        type=_non_blank_str,
         default="Hoyolab — All Games",
         help="Title for the aggregated feed.",
     )
@@ -104,6 +133,13 @@ def cli() -> None:
         type=str,
         help="Optional icon URL for the aggregated feed.",
     )
+    arg_parser.add_argument(
+        "--max-concurrency",
+        type=_non_negative_int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="Maximum number of concurrent Hoyolab requests for the aggregated feed "
+        "(default: %(default)s, 0 = unlimited).",
+    )
 
     arg_parser.add_argument(
         "-l",
@@ -1,5 +1,7 @@
 import asyncio
+import heapq
 import logging
+from operator import attrgetter
 from typing import List
 from typing import Optional
 from typing import Type
@@ -23,6 +25,12 @@ _GFC = TypeVar("_GFC", bound="GameFeedCollection")
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENCY = 16
+
+# only bound the socket operations: the total and connect timeouts would also
+# count the time a request waits for a free connection in the pool
+SESSION_TIMEOUT = aiohttp.ClientTimeout(sock_connect=10, sock_read=30)
+
 
 class GameFeed:
     """Feed generator for a single game."""
@@ -283,3 +291,65 @@ class GameFeedCollection:
         finally:
             if session is None:
                 await local_session.close()
+
+    @staticmethod
+    def _create_session(max_concurrency: int) -> aiohttp.ClientSession:
+        """Create a session that bounds the concurrent requests (0 = unlimited)."""
+
+        # keep connections alive so the concurrent fetches can reuse them; all API
+        # requests go to the same host, so the per-host limit bounds the concurrency
+        # (the total limit must not cap it either)
+        connector = aiohttp.TCPConnector(
+            limit=max(64, max_concurrency) if max_concurrency else 0,
+            limit_per_host=max_concurrency,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+
+        return aiohttp.ClientSession(connector=connector, timeout=SESSION_TIMEOUT)
+
+    async def fetch_all_items(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[FeedItem]:
+        """
+        Fetch the items of all game feeds concurrently and return them combined
+        and sorted (no writing). Games that could not be fetched are skipped, but
+        the first error is raised if no game could be fetched at all.
+
+        If no session is given, requests are limited to max_concurrency at once;
+        waiting for a free connection never times out.
+        """
+
+        local_session = session or self._create_session(max_concurrency)
+
+        try:
+            results = await asyncio.gather(
+                *[feed.fetch_items(local_session) for feed in self._game_feeds],
+                return_exceptions=True,
+            )
+        finally:
+            if session is None:
+                await local_session.close()
+
+        game_items: List[List[FeedItem]] = []
+        fetch_errors: List[BaseException] = []
+        for feed, result in zip(self._game_feeds, results):
+            if isinstance(result, BaseException):
+                fetch_errors.append(result)
+                logger.error(
+                    'Could not fetch items of "%s" feed: %s',
+                    feed._feed_meta.title or feed._feed_meta.game.name.title(),
+                    result,
+                )
+                continue
+
+            game_items.append(result)
+
+        # nothing fetched -> do not let the caller overwrite a feed with no items
+        if len(fetch_errors) > 0 and len(game_items) == 0:
+            raise fetch_errors[0]
+
+        # items per game are already sorted descending by id -> just merge them
+        return list(heapq.merge(*game_items, key=attrgetter("id"), reverse=True))
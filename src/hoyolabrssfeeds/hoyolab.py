@@ -17,6 +17,8 @@ from .models import Language
 HOYOLAB_API_BASE_URL = "https://bbs-api-os.hoyolab.com/community/post/wapi/"
 DEFAULT_CATEGORY_SIZE = 5
 
+_URL_ADAPTER = pydantic.TypeAdapter(pydantic.HttpUrl)
+
 
 class HoyolabNews:
     """Wrapper for Hoyolab REST API endpoints."""
@@ -142,9 +144,7 @@ class HoyolabNews:
 
         params = {"gids": self._game, "page_size": category_size, "type": category}
 
-        url = pydantic.parse_obj_as(
-            pydantic.HttpUrl, HOYOLAB_API_BASE_URL + "getNewsList"
-        )
+        url = _URL_ADAPTER.validate_python(HOYOLAB_API_BASE_URL + "getNewsList")
 
         response = await self._request(session, params, url)
         news_list: List[Dict[str, Any]] = response["data"]["list"]
@@ -158,9 +158,7 @@ class HoyolabNews:
 
         params = {"gids": self._game, "post_id": post_id}
 
-        url = pydantic.parse_obj_as(
-            pydantic.HttpUrl, HOYOLAB_API_BASE_URL + "getPostFull"
-        )
+        url = _URL_ADAPTER.validate_python(HOYOLAB_API_BASE_URL + "getPostFull")
 
         response = await self._request(session, params, url)
         post: Dict[str, Any] = response["data"]["post"]
@@ -189,7 +187,7 @@ class HoyolabNews:
             }
 
             # parsing for type conversions
-            latest_posts.append(pydantic.parse_obj_as(FeedItemMeta, item_meta))
+            latest_posts.append(FeedItemMeta.model_validate(item_meta))
 
         return latest_posts
 
@@ -219,4 +217,4 @@ class HoyolabNews:
         if len(post["cover_list"]) > 0:
             item["image"] = post["cover_list"][0]["url"]
 
-        return pydantic.parse_obj_as(FeedItem, item)
+        return FeedItem.model_validate(item)
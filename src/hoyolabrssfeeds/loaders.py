@@ -20,6 +20,8 @@ from .models import FeedType
 from .writers import AbstractFeedFileWriter
 from .writers import JSONFeedFileWriter
 
+_FEED_ITEMS_ADAPTER = pydantic.TypeAdapter(List[FeedItem])
+
 
 class AbstractFeedFileLoader(metaclass=ABCMeta):
     """ABC for feed file loading functionality."""
@@ -64,12 +66,16 @@ class FeedFileLoaderFactory:
         # prefer json loader if available
         for writer in writers:
             if isinstance(writer, JSONFeedFileWriter):
-                json_config = pydantic.parse_obj_as(FeedFileConfig, writer.config)
+                json_config = FeedFileConfig.model_validate(
+                    writer.config.model_dump(exclude={"url"})
+                )
                 return self.create_loader(json_config)
 
         for writer in writers:
             if writer.config.feed_type in self._loaders:
-                loader_config = pydantic.parse_obj_as(FeedFileConfig, writer.config)
+                loader_config = FeedFileConfig.model_validate(
+                    writer.config.model_dump(exclude={"url"})
+                )
                 return self.create_loader(loader_config)
 
         raise ValueError("Could not create loader from given writers!")
@@ -115,13 +121,13 @@ class JSONFeedFileLoader(AbstractFeedFileLoader):
         except ValueError as err:
             raise FeedFormatError("Could not load JSON feed items!") from err
 
-        return pydantic.parse_obj_as(List[FeedItem], feed_items)
+        return _FEED_ITEMS_ADAPTER.validate_python(feed_items)
 
     async def _load_from_file(self) -> Dict[str, Any]:
         """Load JSON-Feed from file."""
 
         try:
-            async with aiofiles.open(self.config.path, "r") as fd:
+            async with aiofiles.open(self.config.path, "r", encoding="utf-8") as fd:
                 feed_json = await fd.read()
 
             feed: Dict[str, Any] = json.loads(feed_json)
@@ -187,7 +193,7 @@ class AtomFeedFileLoader(AbstractFeedFileLoader):
             feed_items.append(item_dict)
 
         try:
-            return pydantic.parse_obj_as(List[FeedItem], feed_items)
+            return _FEED_ITEMS_ADAPTER.validate_python(feed_items)
         except pydantic.ValidationError as err:
             raise FeedFormatError("Could not load Atom feed entries!") from err
 
@@ -195,7 +201,7 @@ class AtomFeedFileLoader(AbstractFeedFileLoader):
         """Load Atom feed from file."""
 
         try:
-            async with aiofiles.open(self.config.path, "r") as fd:
+            async with aiofiles.open(self.config.path, "r", encoding="utf-8") as fd:
                 feed_str = await fd.read()
 
             # removing default namespace declaration from xml because it makes
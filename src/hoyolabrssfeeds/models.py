@@ -1,24 +1,62 @@
 from datetime import datetime
 from enum import Enum
 from enum import IntEnum, unique
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 from typing import Optional
 from typing import Type
 from typing import TypeVar
+from typing import cast
+import html
 import re
 
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import HttpUrl
-from pydantic import validator
+from pydantic import field_validator
 
 _IC = TypeVar("_IC", bound="FeedItemCategory")
 _G = TypeVar("_G", bound="Game")
 
+# precompiled patterns for the HTML to plain-text conversion
+_RE_BR = re.compile(r"<br\s*/?>", re.IGNORECASE | re.DOTALL)
+_RE_P_CLOSE = re.compile(r"</p\s*>", re.IGNORECASE | re.DOTALL)
+_RE_P_OPEN = re.compile(r"<p[^>]*>", re.IGNORECASE | re.DOTALL)
+_RE_LI_OPEN = re.compile(r"<li[^>]*>\s*", re.IGNORECASE | re.DOTALL)
+_RE_LI_CLOSE = re.compile(r"</li\s*>", re.IGNORECASE | re.DOTALL)
+_RE_ULOL = re.compile(r"</?(ul|ol)[^>]*>", re.IGNORECASE | re.DOTALL)
+_RE_A = re.compile(
+    r'<a[^>]*href="([^"]+)"[^>]*>(.*?)</a\s*>', re.IGNORECASE | re.DOTALL
+)
+_RE_IMG_ALT = re.compile(
+    r'<img[^>]*alt="([^"]*)"[^>]*src="([^"]+)"[^>]*>', re.IGNORECASE | re.DOTALL
+)
+_RE_IMG = re.compile(r'<img[^>]*src="([^"]+)"[^>]*>', re.IGNORECASE | re.DOTALL)
+_RE_TAG = re.compile(r"<[^>]+>", re.IGNORECASE | re.DOTALL)
+_RE_WS = re.compile(r"\s+")
+_RE_CRLF = re.compile(r"\r\n|\r")
+_RE_NL3 = re.compile(r"\n{3,}")
+_RE_SP2 = re.compile(r"[ \t]{2,}")
+
+
+def _tidy_whitespace(text: str) -> str:
+    """Normalise line breaks and collapse repeated blank lines and spaces."""
+    text = _RE_CRLF.sub("\n", text)
+    text = _RE_NL3.sub("\n\n", text)
+    text = _RE_SP2.sub(" ", text)
+    return text.strip()
+
 
 # --- ENUMS ---
 
 
+@lru_cache(maxsize=None)
+def _member_from_str(enum_cls: Type[IntEnum], member_str: str) -> IntEnum:
+    """Cached case-insensitive lookup of an enum member by its name."""
+    return enum_cls[member_str.upper()]
+
+
 @unique
 class FeedItemCategory(IntEnum):
     NOTICES = 1
@@ -28,7 +66,7 @@ class FeedItemCategory(IntEnum):
     @classmethod
     def from_str(cls: Type[_IC], category_str: str) -> _IC:
         try:
-            return cls[category_str.upper()]
+            return cast(_IC, _member_from_str(cls, category_str))
         except KeyError as err:
             raise ValueError('Unknown category "{}"!'.format(category_str)) from err
 
@@ -46,7 +84,7 @@ class Game(IntEnum):
     @classmethod
     def from_str(cls: Type[_G], game_str: str) -> _G:
         try:
-            return cls[game_str.upper()]
+            return cast(_G, _member_from_str(cls, game_str))
         except KeyError as err:
             raise ValueError('Unknown game "{}"!'.format(game_str)) from err
 
@@ -86,11 +124,10 @@ class Language(str, Enum):
 
 
 class MyBaseModel(BaseModel):
-    # https://docs.pydantic.dev/usage/model_config/#options
-    class Config:
-        extra = "forbid"
-        anystr_strip_whitespace = True
-        min_anystr_length = 1
+    # https://docs.pydantic.dev/latest/api/config/
+    model_config = ConfigDict(
+        extra="forbid", str_strip_whitespace=True, str_min_length=1
+    )
 
 
 class FeedMeta(MyBaseModel):
@@ -104,6 +141,9 @@ class FeedMeta(MyBaseModel):
 
 
 class FeedItem(MyBaseModel):
+    # items are shared between category and aggregated feeds -> keep them immutable
+    model_config = ConfigDict(frozen=True)
+
     id: int
     title: str
     author: str
@@ -129,36 +169,36 @@ class FeedItem(MyBaseModel):
         if text is None:
             return None
 
-        # Normalise NBSP and basic entities first
-        txt = (text
-               .replace("&nbsp;", " ")
-               .replace("&amp;", "&")
-               .replace("&lt;", "<")
-               .replace("&gt;", ">"))
+        # Decode all entities first and normalise NBSP
+        txt = html.unescape(text).replace("\xa0", " ")
+
+        # plain text (common for summaries) does not need the tag substitutions
+        if "<" not in txt:
+            return _tidy_whitespace(txt)
 
         # <br> variants → newline
-        txt = re.sub(r"(?is)<br\s*/?>", "\n", txt)
+        txt = _RE_BR.sub("\n", txt)
 
         # Paragraphs: close tags -> blank line; remove opening <p ...>
-        txt = re.sub(r"(?is)</p\s*>", "\n\n", txt)
-        txt = re.sub(r"(?is)<p[^>]*>", "", txt)
+        txt = _RE_P_CLOSE.sub("\n\n", txt)
+        txt = _RE_P_OPEN.sub("", txt)
 
         # Lists: <li>…</li> → bullets; drop list containers
-        txt = re.sub(r"(?is)<li[^>]*>\s*", "• ", txt)
-        txt = re.sub(r"(?is)</li\s*>", "\n", txt)
-        txt = re.sub(r"(?is)</?(ul|ol)[^>]*>", "", txt)
+        txt = _RE_LI_OPEN.sub("• ", txt)
+        txt = _RE_LI_CLOSE.sub("\n", txt)
+        txt = _RE_ULOL.sub("", txt)
 
         # Links: keep anchor text + URL in parentheses
         def _a_sub(m):
             href = m.group(1) or ""
             inner = m.group(2) or ""
-            inner = re.sub(r"\s+", " ", inner).strip()
+            inner = _RE_WS.sub(" ", inner).strip()
             href = href.strip()
             if inner and href:
                 return f"{inner} ({href})"
             return inner or href
 
-        txt = re.sub(r'(?is)<a[^>]*href="([^"]+)"[^>]*>(.*?)</a\s*>', _a_sub, txt)
+        txt = _RE_A.sub(_a_sub, txt)
 
         # Images: show a lightweight marker with alt/src
         def _img_sub(m):
@@ -170,21 +210,17 @@ class FeedItem(MyBaseModel):
                 return f"[img: {src}]"
             return "[img]"
 
-        txt = re.sub(r'(?is)<img[^>]*alt="([^"]*)"[^>]*src="([^"]+)"[^>]*>', _img_sub, txt)
-        txt = re.sub(r'(?is)<img[^>]*src="([^"]+)"[^>]*>', lambda m: f"[img: {m.group(1).strip()}]", txt)
+        txt = _RE_IMG_ALT.sub(_img_sub, txt)
+        txt = _RE_IMG.sub(lambda m: f"[img: {m.group(1).strip()}]", txt)
 
         # Strip any remaining tags
-        txt = re.sub(r"(?is)<[^>]+>", "", txt)
-
-        # Tidy whitespace
-        txt = re.sub(r"\r\n|\r", "\n", txt)
-        txt = re.sub(r"\n{3,}", "\n\n", txt)
-        txt = re.sub(r"[ \t]{2,}", " ", txt)
+        txt = _RE_TAG.sub("", txt)
 
-        return txt.strip()
+        return _tidy_whitespace(txt)
 
     # If a summary comes from upstream HTML, normalize it to a plain-text snippet.
-    @validator("summary", pre=True)
+    @field_validator("summary", mode="before")
+    @classmethod
     def _summary_to_plaintext(cls, v: Optional[str]) -> Optional[str]:
         return cls._html_to_plaintext(v)
 
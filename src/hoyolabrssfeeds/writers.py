@@ -1,4 +1,3 @@
-import json
 from abc import ABCMeta
 from abc import abstractmethod
 from datetime import datetime
@@ -7,9 +6,9 @@ from typing import Dict
 from typing import List
 from typing import Set
 from xml.etree import ElementTree
-import re
 
 import aiofiles
+import orjson
 
 from .errors import FeedIOError
 from .models import FeedFileWriterConfig
@@ -17,19 +16,6 @@ from .models import FeedItem
 from .models import FeedMeta
 from .models import FeedType
 
-def _as_plain_text(html: str) -> str:
-    # Minimal duplicate of model’s normalization in case content slipped through
-    html = (html or "").replace("&nbsp;", " ").replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">")
-    html = re.sub(r"(?i)<br\s*/?>", "\n", html)
-    html = re.sub(r"(?i)</p>\s*<p>", "\n\n", html)
-    html = re.sub(r"(?i)</?p[^>]*>", "", html)
-    html = re.sub(r"(?i)<li[^>]*>\s*", "• ", html)
-    html = re.sub(r"(?i)</li>\s*", "\n", html)
-    html = re.sub(r"(?i)</?(ul|ol)[^>]*>", "", html)
-    html = re.sub(r"<[^>]+>", "", html)
-    html = html.replace("▌", "\n• ").replace("■", "\n• ")
-    html = re.sub(r"\n{3,}", "\n\n", html)
-    return html.strip()
 
 class AbstractFeedFileWriter(metaclass=ABCMeta):
     """ABC for feed file writing functionality."""
@@ -90,9 +76,11 @@ class JSONFeedFileWriter(AbstractFeedFileWriter):
 
         feed["items"] = [self.create_json_feed_item(item) for item in feed_items]
 
+        json_bytes = orjson.dumps(feed)
+
         try:
-            async with aiofiles.open(self.config.path, "w", encoding="utf-8") as fd:
-                await fd.write(json.dumps(feed))
+            async with aiofiles.open(self.config.path, "wb") as fd:
+                await fd.write(json_bytes)
         except IOError as err:
             raise FeedIOError(
                 'Could not write JSON file to "{}"!'.format(self.config.path)
@@ -102,16 +90,7 @@ class JSONFeedFileWriter(AbstractFeedFileWriter):
     def create_json_feed_item(item: FeedItem) -> Dict[str, Any]:
         """Convert FeedItem to JSON-Feed item."""
 
-        # Prefer a plain-text version if the model exposes it
-        try:
-            content_text = item.content_plaintext()
-        except AttributeError:
-            # Fallback: naive HTML -> text (keeps things robust if method is absent)
-            import re as _re
-            content_text = _re.sub(r"(?is)<br\s*/?>", "\n", item.content)
-            content_text = _re.sub(r"(?is)</p\s*>", "\n\n", content_text)
-            content_text = _re.sub(r"(?is)<p[^>]*>", "", content_text)
-            content_text = _re.sub(r"(?is)<[^>]+>", "", content_text).strip()
+        content_text = item.content_plaintext()
 
         json_item = {
             "id": str(item.id),
@@ -180,14 +159,14 @@ class AtomFeedFileWriter(AbstractFeedFileWriter):
                 root,
                 "link",
                 {
-                    "href": self.config.url,
+                    "href": str(self.config.url),
                     "rel": "self",
                     "type": "application/atom+xml",
                 },
             )
 
         if feed_meta.icon:
-            ElementTree.SubElement(root, "icon").text = feed_meta.icon
+            ElementTree.SubElement(root, "icon").text = str(feed_meta.icon)
 
         entries = self.create_atom_feed_entries(feed_items)
         root.extend(entries)
@@ -248,14 +227,7 @@ class AtomFeedFileWriter(AbstractFeedFileWriter):
             ElementTree.SubElement(entry, "content", {"type": "html"}).text = item.content
 
             # Always provide a plain-text summary (good for consumers like MonitoRSS)
-            try:
-                summary_text = item.summary or item.content_plaintext()
-            except AttributeError:
-                # Fallback if the helper isn't present on the model
-                import re as _re
-                summary_text = item.summary or _re.sub(r"(?is)<[^>]+>", "", item.content)
-                summary_text = _re.sub(r"(?is)<br\s*/?>", "\n", summary_text)
-                summary_text = _re.sub(r"\n{3,}", "\n\n", summary_text).strip()
+            summary_text = item.summary or item.content_plaintext()
 
             if summary_text:
                 ElementTree.SubElement(entry, "summary").text = summary_text
@@ -78,7 +78,7 @@ def json_feed_file_writer_config(json_path: Path) -> models.FeedFileWriterConfig
     return models.FeedFileWriterConfig(
         feed_type=models.FeedType.JSON,
         path=json_path,
-        url=pydantic.parse_obj_as(pydantic.HttpUrl, "https://example.org/"),
+        url=pydantic.HttpUrl("https://example.org/"),
     )
 
 
@@ -87,7 +87,7 @@ def atom_feed_file_writer_config(atom_path: Path) -> models.FeedFileWriterConfig
     return models.FeedFileWriterConfig(
         feed_type=models.FeedType.ATOM,
         path=atom_path,
-        url=pydantic.parse_obj_as(pydantic.HttpUrl, "https://example.org/"),
+        url=pydantic.HttpUrl("https://example.org/"),
     )
 
 
@@ -169,14 +169,13 @@ def feed_item() -> models.FeedItem:
         category=models.FeedItemCategory.INFO,
         published=datetime(2022, 10, 3, 16).astimezone(),
         updated=datetime(2022, 10, 3, 18).astimezone(),
-        image=pydantic.parse_obj_as(pydantic.HttpUrl, "https://example.org/"),
+        image=pydantic.HttpUrl("https://example.org/"),
     )
 
 
 @pytest.fixture
 def feed_item_list(feed_item: models.FeedItem) -> List[models.FeedItem]:
-    other_item = feed_item.copy()
-    other_item.id -= 1
+    other_item = feed_item.model_copy(update={"id": feed_item.id - 1})
     return [feed_item, other_item]
 
 
@@ -246,7 +245,7 @@ def feed_meta() -> models.FeedMeta:
         categories=[c for c in models.FeedItemCategory],
         language=models.Language.GERMAN,
         title="Example Feed",
-        icon=pydantic.parse_obj_as(pydantic.HttpUrl, "https://example.org/"),
+        icon=pydantic.HttpUrl("https://example.org/"),
     )
 
 
@@ -254,9 +253,7 @@ def feed_meta() -> models.FeedMeta:
 def category_feeds(feed_item: models.FeedItem) -> List[List[models.FeedItem]]:
     cat_feeds: List[List[models.FeedItem]] = []
     for i, cat in enumerate(models.FeedItemCategory):
-        item = feed_item.copy()
-        item.id += i
-        item.category = cat
+        item = feed_item.model_copy(update={"id": feed_item.id + i, "category": cat})
         cat_feeds.append([item])
 
     return cat_feeds
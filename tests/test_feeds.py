@@ -1,9 +1,12 @@
+import asyncio
 from datetime import datetime
-from typing import List, Any
+from typing import List, Any, Dict
 
 import aiohttp
 import pytest
 import pytest_mock
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from hoyolabrssfeeds import feeds
 from hoyolabrssfeeds import models
@@ -80,10 +83,13 @@ async def test_category_feed_new_item(
 ) -> None:
     feed_meta.category_size = 2
 
-    new_item = feed_item.copy()
-    new_item.id += 1
-    new_item.published = datetime.now()
-    new_item.updated = datetime.now()
+    new_item = feed_item.model_copy(
+        update={
+            "id": feed_item.id + 1,
+            "published": datetime.now(),
+            "updated": datetime.now(),
+        }
+    )
 
     mocked_metas = mocker.patch(
         "hoyolabrssfeeds.feeds.HoyolabNews.get_latest_item_metas",
@@ -129,11 +135,9 @@ async def test_category_feed_updated_item(
 ) -> None:
     feed_meta.category_size = 2
 
-    updated_item = feed_item.copy()
-    updated_item.updated = datetime.now().astimezone()
+    updated_item = feed_item.model_copy(update={"updated": datetime.now().astimezone()})
 
-    other_item = feed_item.copy()
-    other_item.id += 1
+    other_item = feed_item.model_copy(update={"id": feed_item.id + 1})
 
     mocked_metas = mocker.patch(
         "hoyolabrssfeeds.feeds.HoyolabNews.get_latest_item_metas",
@@ -361,3 +365,120 @@ async def test_invalid_feed_collection(
             [mocked_writers],
             [mocked_loader, mocked_loader, mocked_loader],
         )
+
+
+async def test_fetch_all_items(
+    mocker: pytest_mock.MockFixture,
+    caplog: pytest.LogCaptureFixture,
+    feed_meta: models.FeedMeta,
+    mocked_writers: List[AbstractFeedFileWriter],
+    mocked_loader: AbstractFeedFileLoader,
+    feed_item: models.FeedItem,
+) -> None:
+    other_item = feed_item.model_copy(update={"id": feed_item.id + 1})
+
+    mocker.patch(
+        "hoyolabrssfeeds.feeds.GameFeed.fetch_items",
+        side_effect=[[feed_item], [other_item], ValueError("Failed")],
+    )
+
+    collection = feeds.GameFeedCollection(
+        [feed_meta, feed_meta, feed_meta],
+        [mocked_writers, mocked_writers, mocked_writers],
+        [mocked_loader, mocked_loader, mocked_loader],
+    )
+
+    with caplog.at_level("ERROR"):
+        items = await collection.fetch_all_items()
+        assert "Could not fetch items" in caplog.text
+
+    assert items == [other_item, feed_item]
+
+    # all games failed -> raise instead of returning an empty feed
+    mocker.patch(
+        "hoyolabrssfeeds.feeds.GameFeed.fetch_items",
+        side_effect=ValueError("Failed"),
+    )
+
+    with pytest.raises(ValueError, match="Failed"):
+        await collection.fetch_all_items()
+
+
+async def test_fetch_all_items_bounded_concurrency(
+    mocker: pytest_mock.MockFixture,
+    feed_meta: models.FeedMeta,
+    mocked_writers: List[AbstractFeedFileWriter],
+    mocked_loader: AbstractFeedFileLoader,
+) -> None:
+    active_requests = 0
+    max_active_requests = 0
+
+    async def slow_handler(request: web.Request) -> web.Response:
+        nonlocal active_requests, max_active_requests
+        active_requests += 1
+        max_active_requests = max(max_active_requests, active_requests)
+        await asyncio.sleep(0.05)
+        active_requests -= 1
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_get("/", slow_handler)
+
+    async with TestServer(app) as server:
+        server_url = str(server.make_url("/"))
+
+        # answer like the Hoyolab API, but only after a request to the slow server
+        async def fake_request(
+            api: Any, session: aiohttp.ClientSession, params: Dict[str, Any], url: Any
+        ) -> Dict[str, Any]:
+            async with session.get(server_url) as response:
+                response.raise_for_status()
+
+            post_id = str(params["gids"] * 10 + params.get("type", 0))
+            if str(url).endswith("getNewsList"):
+                post = {"post": {"post_id": post_id, "created_at": 1}}
+                return {"data": {"list": [dict(post, last_modify_time=0)]}}
+
+            category = int(params["post_id"]) % 10
+            post = {
+                "post_id": params["post_id"],
+                "subject": "Title",
+                "content": "<p>Content</p>",
+                "official_type": category,
+                "created_at": 1,
+            }
+            return {
+                "data": {
+                    "post": {
+                        "post": post,
+                        "user": {"nickname": "Author"},
+                        "last_modify_time": 0,
+                        "cover_list": [],
+                        "video": None,
+                    }
+                }
+            }
+
+        mocker.patch("hoyolabrssfeeds.hoyolab.HoyolabNews._request", new=fake_request)
+
+        # waiting in the pool (~12 requests x 0.05s) must not count as a timeout
+        mocker.patch(
+            "hoyolabrssfeeds.feeds.SESSION_TIMEOUT",
+            aiohttp.ClientTimeout(sock_connect=0.1, sock_read=1),
+        )
+
+        other_meta = feed_meta.model_copy(update={"game": models.Game.HONKAI})
+        collection = feeds.GameFeedCollection(
+            [feed_meta, other_meta],
+            [mocked_writers, mocked_writers],
+            [mocked_loader, mocked_loader],
+        )
+
+        items = await collection.fetch_all_items(max_concurrency=1)
+
+    assert max_active_requests == 1
+    assert {(item.game, item.category) for item in items} == {
+        (meta.game, category)
+        for meta in (feed_meta, other_meta)
+        for category in models.FeedItemCategory
+    }
@@ -71,26 +71,23 @@ async def test_request_errors(client_session: aiohttp.ClientSession) -> None:
     api = hoyolab.HoyolabNews(models.Game.GENSHIN)
 
     # request error
-    error_url = pydantic.parse_obj_as(
-        pydantic.HttpUrl, "https://httpbin.org/status/500"
-    )
+    error_url = pydantic.HttpUrl("https://httpbin.org/status/500")
     with pytest.raises(errors.HoyolabApiError, match="Could not request"):
         await api._request(client_session, {}, error_url)
 
     # decode error
-    error_url = pydantic.parse_obj_as(pydantic.HttpUrl, "https://httpbin.org/html")
+    error_url = pydantic.HttpUrl("https://httpbin.org/html")
     with pytest.raises(errors.HoyolabApiError, match="Could not decode"):
         await api._request(client_session, {}, error_url)
 
     # unexpected response
-    error_url = pydantic.parse_obj_as(pydantic.HttpUrl, "https://httpbin.org/json")
+    error_url = pydantic.HttpUrl("https://httpbin.org/json")
     with pytest.raises(errors.HoyolabApiError, match="Unexpected response"):
         await api._request(client_session, {}, error_url)
 
     # hoyolab error code
-    error_url = pydantic.parse_obj_as(
-        pydantic.HttpUrl,
-        "https://bbs-api-os.hoyolab.com/community/post/wapi/getNewsList",
+    error_url = pydantic.HttpUrl(
+        "https://bbs-api-os.hoyolab.com/community/post/wapi/getNewsList"
     )
     with pytest.raises(errors.HoyolabApiError):
         # missing params raise exception here
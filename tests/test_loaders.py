@@ -101,6 +101,28 @@ async def test_json_feed_loader(
     assert loaded_items == feed_item_list
 
 
+async def test_json_feed_non_ascii_roundtrip(
+    feed_meta: models.FeedMeta,
+    feed_item_list: List[models.FeedItem],
+    json_feed_file_writer_config: models.FeedFileWriterConfig,
+    json_feed_file_config: models.FeedFileConfig,
+) -> None:
+    items = [
+        item.model_copy(
+            update={"title": "原神 — ข่าว", "content": "<p>• Ünïcödé — 更新</p>"}
+        )
+        for item in feed_item_list
+    ]
+
+    writer = writers.JSONFeedFileWriter(json_feed_file_writer_config)
+    await writer.write_feed(feed_meta, items)
+
+    loader = loaders.JSONFeedFileLoader(json_feed_file_config)
+    loaded_items = await loader.get_feed_items()
+
+    assert loaded_items == items
+
+
 async def test_invalid_json_feed_values(
     mocker: pytest_mock.MockFixture,
     json_feed_items: Dict[str, Any],
@@ -204,8 +226,9 @@ async def test_atom_feed_loader(
     )
 
     # images cannot be stored in atom feeds
-    for feed_item in feed_item_list:
-        feed_item.image = None
+    feed_item_list = [
+        feed_item.model_copy(update={"image": None}) for feed_item in feed_item_list
+    ]
 
     # needed for get_feed_items() to work for this test
     atom_feed_file_config.path.touch()
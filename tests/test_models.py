@@ -1,6 +1,7 @@
-from hoyolabrssfeeds import models
 import pytest
 
+from hoyolabrssfeeds import models
+
 # -- NOTE: This module does only test custom methods for pydantic models! --
 
 
@@ -22,3 +23,26 @@ def test_game_from_str(game: models.Game) -> None:
 def test_invalid_game_str() -> None:
     with pytest.raises(ValueError):
         models.Game.from_str("Invalid")
+
+
+def test_content_plaintext(feed_item: models.FeedItem) -> None:
+    content = (
+        "<p>Hello&nbsp;<b>World</b> &#39;&amp;&#39;</p>"
+        '<ul><li> One</li><li><a href="https://example.org/">Two</a></li></ul>'
+        '<img alt="Pic" src="https://example.org/a.png"><br>End'
+    )
+    feed_item = feed_item.model_copy(update={"content": content})
+
+    assert feed_item.content_plaintext() == (
+        "Hello World '&'\n\n"
+        "• One\n"
+        "• Two (https://example.org/)\n"
+        "[img: Pic — https://example.org/a.png]\nEnd"
+    )
+
+
+def test_plaintext_summary(feed_item: models.FeedItem) -> None:
+    item_dict = feed_item.model_dump()
+    item_dict["summary"] = "  Plain  text\r\nsummary "
+
+    assert models.FeedItem(**item_dict).summary == "Plain text\nsummary"